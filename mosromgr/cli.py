@@ -7,9 +7,6 @@ import argparse
 import logging
 import warnings
 
-from .mostypes import MosFile, RunningOrder
-from .moscollection import MosCollection
-from .utils import s3
 from .exc import MosRoMgrException, MosInvalidXML, UnknownMosFileType, InvalidMosCollection
 from . import __version__
 
@@ -165,6 +162,8 @@ class CLI:
         return parser, commands.choices
 
     def get_mos_object_from_file(self, mos_file_path):
+        from .mostypes import MosFile
+
         try:
             return MosFile.from_file(mos_file_path)
         except MosInvalidXML as e:
@@ -173,6 +172,8 @@ class CLI:
             sys.stderr.write(f"{mos_file_path}: Unknown MOS file type\n")
 
     def get_mos_object_from_s3(self, bucket, file_key):
+        from .mostypes import MosFile
+
         try:
             return MosFile.from_s3(bucket_name=bucket, mos_file_key=file_key)
         except MosInvalidXML as e:
@@ -195,6 +196,9 @@ class CLI:
         return self.detect_or_inspect(inspect=True)
 
     def detect_or_inspect(self, inspect=False):
+        from .mostypes import MosFile
+        from .utils import s3
+
         if self._args.files:
             for file in self._args.files:
                 try:
@@ -247,6 +251,8 @@ class CLI:
             print(f"{filename}: {mo.__class__.__name__}")
 
     def do_merge(self):
+        from .moscollection import MosCollection
+
         self._args.cmd = 'merge'
         try:
             if self._args.files:
@@ -42,7 +42,7 @@ class MosReader:
                    restore_args=(mos_file_path, ))
 
     @classmethod
-    def from_string(cls, mos_file_contents: str):
+    def from_string(cls, mos_file_contents: Union[str, bytes]):
         mo = MosFile.from_string(mos_file_contents)
         # store a method of restoring the mos object from the determined class
         return cls(mo,
@@ -263,18 +263,18 @@ class MosCollection:
         ro_id = self.mos_readers[0].ro_id
         assert all(mr.ro_id == ro_id for mr in self.mos_readers), "Mixed RO IDs found"
         ro_creates = [
-            mr for mr in self.mos_readers if mr.mos_type == RunningOrder
+            mr for mr in self.mos_readers if mr.mos_type is RunningOrder
         ]
         assert len(ro_creates) == 1, f"{len(ro_creates)} roCreates found"
         self._ro = ro_creates[0].mos_object
         ro_deletes = [
-            mr for mr in self.mos_readers if mr.mos_type == RunningOrderEnd
+            mr for mr in self.mos_readers if mr.mos_type is RunningOrderEnd
         ]
         assert len(ro_deletes) < 2, f"{len(ro_deletes)} roDeletes found"
         if not allow_incomplete:
             assert len(ro_deletes) == 1, f"{len(ro_deletes)} roDeletes found"
         self._mos_readers = [
-            mr for mr in self.mos_readers if mr.mos_type != RunningOrder
+            mr for mr in self.mos_readers if mr.mos_type is not RunningOrder
         ]
 
     def merge(self, *, strict: bool = True):
@@ -17,7 +17,10 @@ from datetime import datetime
 import xmltodict
 from dateutil.parser import parse
 
-from .utils.xml import remove_node, replace_node, insert_node, find_child, append_node
+from .utils.xml import (
+    remove_node, replace_node, insert_node, find_child, append_node,
+    replace_children
+)
 from .utils import s3
 from .moselements import Story, Item
 from .exc import (
@@ -36,7 +39,7 @@ class MosFile:
     Base class for all MOS files
     """
     def __init__(self, xml: Element):
-        if type(xml) != Element:
+        if type(xml) is not Element:
             raise TypeError("MosFile objects should be constructed using from_ classmethods")
         self._xml = xml
         self._base_tag = None
@@ -60,14 +63,15 @@ class MosFile:
         return cls(xml)
 
     @classmethod
-    def from_string(cls, mos_xml_string: str):
+    def from_string(cls, mos_xml_string: Union[str, bytes]):
         """
         Construct from an XML string of a MOS document
 
         :type mos_xml_string:
-            str
+            Union[str, bytes]
         :param mos_xml_string:
-            The XML string of the MOS document
+            The XML string of the MOS document. Bytes are passed straight to
+            the parser, which decodes them according to the XML declaration.
         """
         try:
             xml = ElementTree.fromstring(mos_xml_string)
@@ -100,27 +104,11 @@ class MosFile:
         """
         Classify the MOS type and return an instance of the relevant class
         """
-        tag_class_map = {
-            'roCreate': RunningOrder,
-            'roStorySend': StorySend,
-            'roStoryAppend': StoryAppend,
-            'roStoryDelete': StoryDelete,
-            'roStoryInsert': StoryInsert,
-            'roStoryMove': StoryMove,
-            'roStoryReplace': StoryReplace,
-            'roItemDelete': ItemDelete,
-            'roItemInsert': ItemInsert,
-            'roItemMoveMultiple': ItemMoveMultiple,
-            'roItemReplace': ItemReplace,
-            'roReplace': RunningOrderReplace,
-            'roMetadataReplace': MetaDataReplace,
-            'roReadyToAir': ReadyToAir,
-            'roDelete': RunningOrderEnd,
-            'roElementAction': ElementAction,
-        }
-        for tag, subcls in tag_class_map.items():
-            if xml.find(tag):
-                if subcls == ElementAction:
+        # the message type is given by the first recognised child of <mos>
+        for child in xml:
+            subcls = _TAG_CLASS_MAP.get(child.tag)
+            if subcls is not None:
+                if subcls is ElementAction:
                     return ElementAction._classify(xml)
                 return subcls(xml)
         raise UnknownMosFileType("Unable to determine MOS file type")
@@ -943,23 +931,49 @@ class ItemMoveMultiple(MosFile):
                 f"{self.__class__.__name__} error in {self.message_id} - story not found"
             )
 
+        # map item IDs to the story's item elements in a single pass, keeping
+        # the first item for any repeated ID as find_child does
+        story_items = {}
+        for child in story:
+            if child.tag == 'item':
+                story_items.setdefault(child.findtext('itemID'), child)
+
         if self.item is None:
-            target_item_index = len(story)
+            target_item = None
         else:
-            target_item, target_item_index = find_child(parent=story, child_tag='item', id=self.item.id)
+            target_item = story_items.get(self.item.id)
             if target_item is None:
                 raise MosMergeError(
                     f"{self.__class__.__name__} error in {self.message_id} - target item not found"
                 )
 
-        for i, item in enumerate(self.items, start=target_item_index):
-            source_item, source_item_index = find_child(parent=story, child_tag='item', id=item.id)
-            if source_item_index is None:
+        source_items = []
+        for item in self.items:
+            source_item = story_items.get(item.id)
+            if source_item is None:
                 raise MosMergeError(
                     f"{self.__class__.__name__} error in {self.message_id} - source item not found"
                 )
-            remove_node(parent=story, node=source_item)
-            insert_node(parent=story, node=source_item, index=i)
+            source_items.append(source_item)
+
+        # detach all the source items in a single pass, then put them back
+        # above the target item (or at the end of the story)
+        source_item_set = set(source_items)
+        if len(source_item_set) != len(source_items):
+            raise MosMergeError(
+                f"{self.__class__.__name__} error in {self.message_id} - duplicate source item"
+            )
+        if target_item in source_item_set:
+            raise MosMergeError(
+                f"{self.__class__.__name__} error in {self.message_id} - target item is also a source item"
+            )
+        remaining = [child for child in story if child not in source_item_set]
+        if target_item is None:
+            target_item_index = len(remaining)
+        else:
+            target_item_index = remaining.index(target_item)
+        remaining[target_item_index:target_item_index] = source_items
+        replace_children(parent=story, nodes=remaining)
 
         return ro
 
@@ -1274,19 +1288,10 @@ class ElementAction(MosFile):
 
         # use the combination of operation, target_item and source_item to
         # determine the subclass
-        subcls = {
-            # (operation, target, item): subcls
-            ('REPLACE', False, False): EAStoryReplace,
-            ('REPLACE', True, False): EAItemReplace,
-            ('DELETE', False, False): EAStoryDelete,
-            ('DELETE', False, True): EAItemDelete,
-            ('INSERT', False, False): EAStoryInsert,
-            ('INSERT', True, False): EAItemInsert,
-            ('SWAP', False, False): EAStorySwap,
-            ('SWAP', False, True): EAItemSwap,
-            ('MOVE', False, False): EAStoryMove,
-            ('MOVE', True, True): EAItemMove,
-        }[(operation, target_item, source_item)]
+        try:
+            subcls = _EA_CLASS_MAP[(operation, target_item, source_item)]
+        except KeyError:
+            raise UnknownMosFileType("Unable to determine roElementAction type")
         return subcls(xml)
 
     @property
@@ -1974,4 +1979,41 @@ class EAItemMove(ElementAction):
         """
         print("IN STORY:", self.story.id)
         for item in self.items:
-            print("  MOVE ITEM:", item.id)
\ No newline at end of file
+            print("  MOVE ITEM:", item.id)
+
+
+# map of base tag names to MosFile subclasses, used by MosFile._classify
+_TAG_CLASS_MAP = {
+    'roCreate': RunningOrder,
+    'roStorySend': StorySend,
+    'roStoryAppend': StoryAppend,
+    'roStoryDelete': StoryDelete,
+    'roStoryInsert': StoryInsert,
+    'roStoryMove': StoryMove,
+    'roStoryReplace': StoryReplace,
+    'roItemDelete': ItemDelete,
+    'roItemInsert': ItemInsert,
+    'roItemMoveMultiple': ItemMoveMultiple,
+    'roItemReplace': ItemReplace,
+    'roReplace': RunningOrderReplace,
+    'roMetadataReplace': MetaDataReplace,
+    'roReadyToAir': ReadyToAir,
+    'roDelete': RunningOrderEnd,
+    'roElementAction': ElementAction,
+}
+
+# map of (operation, target item, source item) to ElementAction subclasses,
+# used by ElementAction._classify
+_EA_CLASS_MAP = {
+    # (operation, target, item): subcls
+    ('REPLACE', False, False): EAStoryReplace,
+    ('REPLACE', True, False): EAItemReplace,
+    ('DELETE', False, False): EAStoryDelete,
+    ('DELETE', False, True): EAItemDelete,
+    ('INSERT', False, False): EAStoryInsert,
+    ('INSERT', True, False): EAItemInsert,
+    ('SWAP', False, False): EAStorySwap,
+    ('SWAP', False, True): EAItemSwap,
+    ('MOVE', False, False): EAStoryMove,
+    ('MOVE', True, True): EAItemMove,
+}
@@ -2,7 +2,7 @@
 # Copyright 2021 BBC
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Optional, Tuple
+from typing import Optional, Tuple, List
 from xml.etree.ElementTree import Element
 
 
@@ -35,6 +35,13 @@ def append_node(parent, node):
     parent.append(node)
 
 
+def replace_children(parent: Element, nodes: List[Element]):
+    """
+    Replace all the children of *parent* with *nodes*, in order.
+    """
+    parent[:] = nodes
+
+
 def find_child(
         parent: Element,
         child_tag: str,
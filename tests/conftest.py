@@ -2,456 +2,266 @@
 # Copyright 2021 BBC
 # SPDX-License-Identifier: Apache-2.0
 
+import copy
 from pathlib import Path
+from functools import lru_cache
 from xml.etree import ElementTree
 
 import pytest
 
+from mosromgr.mostypes import RunningOrder
+
 
 HERE = Path(__file__).parent.absolute()
 MOCK_MOS = HERE / 'mock_mos'
 MOCK_XML = HERE / 'mock_xml'
 
 
-@pytest.fixture()
-def invalid_xml():
-    return MOCK_XML / 'invalid.xml'
-
-@pytest.fixture()
-def rocreate():
-    return MOCK_MOS / 'roCreate.mos.xml'
-
-@pytest.fixture()
-def rocreate2():
-    return MOCK_MOS / 'roCreate2.mos.xml'
-    
-# roCreate with notes
-@pytest.fixture()
-def rocreate3():
-    return MOCK_MOS / 'roCreate3.mos.xml'
-    
-# roCreate with no roEdStart
-@pytest.fixture()
-def rocreate4():
-    return MOCK_MOS / 'roCreate4.mos.xml'
-    
-# roCreate with empty roEdStart
-@pytest.fixture()
-def rocreate5():
-    return MOCK_MOS / 'roCreate5.mos.xml'
-    
-# roCreate with no roEdStart or story durations
-@pytest.fixture()
-def rocreate6():
-    return MOCK_MOS / 'roCreate6.mos.xml'
-
-@pytest.fixture()
-def rostorysend1():
-    return MOCK_MOS / 'roStorySend1.mos.xml'
-
-@pytest.fixture()
-def rostorysend2():
-    return MOCK_MOS / 'roStorySend2.mos.xml'
-
-@pytest.fixture()
-def eastoryreplace():
-    return MOCK_MOS / 'roElementActionStoryReplace.mos.xml'
-
-# eastoryreplace with unknown story
-@pytest.fixture()
-def eastoryreplace2():
-    return MOCK_MOS / 'roElementActionStoryReplace2.mos.xml'
-
-@pytest.fixture()
-def eaitemreplace():
-    return MOCK_MOS / 'roElementActionItemReplace.mos.xml'
-
-# eaitemreplace with unknown story
-@pytest.fixture()
-def eaitemreplace2():
-    return MOCK_MOS / 'roElementActionItemReplace2.mos.xml'
-
-# eaitemreplace with unknown item
-@pytest.fixture()
-def eaitemreplace3():
-    return MOCK_MOS / 'roElementActionItemReplace3.mos.xml'
-
-@pytest.fixture()
-def eastorydelete():
-    return MOCK_MOS / 'roElementActionStoryDelete.mos.xml'
-
-# eastorydelete with unknown story
-@pytest.fixture()
-def eastorydelete2():
-    return MOCK_MOS / 'roElementActionStoryDelete2.mos.xml'
-
-@pytest.fixture()
-def eaitemdelete():
-    return MOCK_MOS / 'roElementActionItemDelete.mos.xml'
-
-# eaitemdelete with unknown story
-@pytest.fixture()
-def eaitemdelete2():
-    return MOCK_MOS / 'roElementActionItemDelete2.mos.xml'
-
-# eaitemdelete with unknown item
-@pytest.fixture()
-def eaitemdelete3():
-    return MOCK_MOS / 'roElementActionItemDelete3.mos.xml'
-
-@pytest.fixture()
-def eastoryinsert():
-    return MOCK_MOS / 'roElementActionStoryInsert.mos.xml'
-
-# eastoryinsert with empty story id
-@pytest.fixture()
-def eastoryinsert2():
-    return MOCK_MOS / 'roElementActionStoryInsert2.mos.xml'
-
-# eastoryinsert with unknown story
-@pytest.fixture()
-def eastoryinsert3():
-    return MOCK_MOS / 'roElementActionStoryInsert3.mos.xml'
-
-# eastoryinsert with duplicate story
-@pytest.fixture()
-def eastoryinsert4():
-    return MOCK_MOS / 'roElementActionStoryInsert4.mos.xml'
-
-@pytest.fixture()
-def eaiteminsert():
-    return MOCK_MOS / 'roElementActionItemInsert.mos.xml'
-
-# eaiteminsert with unknown story
-@pytest.fixture()
-def eaiteminsert2():
-    return MOCK_MOS / 'roElementActionItemInsert2.mos.xml'
-
-# eaiteminsert with no item id
-@pytest.fixture()
-def eaiteminsert3():
-    return MOCK_MOS / 'roElementActionItemInsert3.mos.xml'
-
-# eaiteminsert with unknown item
-@pytest.fixture()
-def eaiteminsert4():
-    return MOCK_MOS / 'roElementActionItemInsert4.mos.xml'
-
-# eastoryswap with empty element_target
-@pytest.fixture()
-def eastoryswap():
-    return MOCK_MOS / 'roElementActionStorySwap.mos.xml'
-
-# eastoryswap with empty storyid in element_target
-@pytest.fixture()
-def eastoryswap2():
-    return MOCK_MOS / 'roElementActionStorySwap2.mos.xml'
-
-# eastoryswap with unknown story 1
-@pytest.fixture()
-def eastoryswap3():
-    return MOCK_MOS / 'roElementActionStorySwap3.mos.xml'
-
-# eastoryswap with unknown story 2
-@pytest.fixture()
-def eastoryswap4():
-    return MOCK_MOS / 'roElementActionStorySwap4.mos.xml'
-
-@pytest.fixture()
-def eaitemswap():
-    return MOCK_MOS / 'roElementActionItemSwap.mos.xml'
-
-# eaitemswap with unknown story
-@pytest.fixture()
-def eaitemswap2():
-    return MOCK_MOS / 'roElementActionItemSwap2.mos.xml'
-
-# eaitemswap with unknown item 1
-@pytest.fixture()
-def eaitemswap3():
-    return MOCK_MOS / 'roElementActionItemSwap3.mos.xml'
-
-# eaitemswap with unknown item 2
-@pytest.fixture()
-def eaitemswap4():
-    return MOCK_MOS / 'roElementActionItemSwap4.mos.xml'
-
-@pytest.fixture()
-def eastorymove():
-    return MOCK_MOS / 'roElementActionStoryMove.mos.xml'
-
-# eastorymove with no target story
-@pytest.fixture()
-def eastorymove2():
-    return MOCK_MOS / 'roElementActionStoryMove2.mos.xml'
-
-# eastorymove with unknown target story
-@pytest.fixture()
-def eastorymove3():
-    return MOCK_MOS / 'roElementActionStoryMove3.mos.xml'
-
-# eastorymove with unknown source story
-@pytest.fixture()
-def eastorymove4():
-    return MOCK_MOS / 'roElementActionStoryMove4.mos.xml'
-
-@pytest.fixture()
-def eaitemmove():
-    return MOCK_MOS / 'roElementActionItemMove.mos.xml'
-
-# eaitemmove with unknown story
-@pytest.fixture()
-def eaitemmove2():
-    return MOCK_MOS / 'roElementActionItemMove2.mos.xml'
-
-# eaitemmove with unknown target item
-@pytest.fixture()
-def eaitemmove3():
-    return MOCK_MOS / 'roElementActionItemMove3.mos.xml'
-
-# eaitemmove with unknown source item
-@pytest.fixture()
-def eaitemmove4():
-    return MOCK_MOS / 'roElementActionItemMove4.mos.xml'
-
-@pytest.fixture()
-def rostoryappend():
-    return MOCK_MOS / 'roStoryAppend.mos.xml'
-
-@pytest.fixture()
-def rostoryreplace():
-    return MOCK_MOS / 'roStoryReplace.mos.xml'
-
-# storyreplace with unknown story
-@pytest.fixture()
-def rostoryreplace2():
-    return MOCK_MOS / 'roStoryReplace2.mos.xml'
-
-# storyreplace with no stories
-@pytest.fixture()
-def rostoryreplace3():
-    return MOCK_MOS / 'roStoryReplace3.mos.xml'
-
-@pytest.fixture()
-def roitemreplace():
-    return MOCK_MOS / 'roItemReplace.mos.xml'
-
-# itemreplace with unknown story
-@pytest.fixture()
-def roitemreplace2():
-    return MOCK_MOS / 'roItemReplace2.mos.xml'
-
-# itemreplace with unknown item
-@pytest.fixture()
-def roitemreplace3():
-    return MOCK_MOS / 'roItemReplace3.mos.xml'
-
-@pytest.fixture()
-def rostorydelete():
-    return MOCK_MOS / 'roStoryDelete.mos.xml'
-
-# storydelete with unknown story
-@pytest.fixture()
-def rostorydelete2():
-    return MOCK_MOS / 'roStoryDelete2.mos.xml'
-
-@pytest.fixture()
-def roitemdelete():
-    return MOCK_MOS / 'roItemDelete.mos.xml'
-
-# itemdelete with unknown story
-@pytest.fixture()
-def roitemdelete2():
-    return MOCK_MOS / 'roItemDelete2.mos.xml'
-
-# itemdelete with unknown item
-@pytest.fixture()
-def roitemdelete3():
-    return MOCK_MOS / 'roItemDelete3.mos.xml'
-
-# itemdelete with no item id
-@pytest.fixture()
-def roitemdelete4():
-    return MOCK_MOS / 'roItemDelete4.mos.xml'
-
-@pytest.fixture()
-def rostoryinsert():
-    return MOCK_MOS / 'roStoryInsert.mos.xml'
-
-# storyinsert with unknown story
-@pytest.fixture()
-def rostoryinsert2():
-    return MOCK_MOS / 'roStoryInsert2.mos.xml'
-
-# storyinsert with source story which already exists in RO
-@pytest.fixture()
-def rostoryinsert3():
-    return MOCK_MOS / 'roStoryInsert3.mos.xml'
-
-@pytest.fixture()
-def roiteminsert():
-    return MOCK_MOS / 'roItemInsert.mos.xml'
-
-# iteminsert with unknown story
-@pytest.fixture()
-def roiteminsert2():
-    return MOCK_MOS / 'roItemInsert2.mos.xml'
-
-# iteminsert with unknown item
-@pytest.fixture()
-def roiteminsert3():
-    return MOCK_MOS / 'roItemInsert3.mos.xml'
-
-# iteminsert with no item id
-@pytest.fixture()
-def roiteminsert4():
-    return MOCK_MOS / 'roItemInsert4.mos.xml'
-
-# iteminsert with item id already in RO
-@pytest.fixture()
-def roiteminsert5():
-    return MOCK_MOS / 'roItemInsert5.mos.xml'
-
-# iteminsert with no items
-@pytest.fixture()
-def roiteminsert6():
-    return MOCK_MOS / 'roItemInsert6.mos.xml'
-
-@pytest.fixture()
-def rostorymove():
-    return MOCK_MOS / 'roStoryMove.mos.xml'
-
-# storymove with no target story
-@pytest.fixture()
-def rostorymove2():
-    return MOCK_MOS / 'roStoryMove2.mos.xml'
-
-# storymove with no stories
-@pytest.fixture()
-def rostorymove3():
-    return MOCK_MOS / 'roStoryMove3.mos.xml'
-
-# storymove with unknown source story
-@pytest.fixture()
-def rostorymove4():
-    return MOCK_MOS / 'roStoryMove4.mos.xml'
-
-# storymove with unknown target story
-@pytest.fixture()
-def rostorymove5():
-    return MOCK_MOS / 'roStoryMove5.mos.xml'
-
-@pytest.fixture()
-def roitemmovemultiple():
-    return MOCK_MOS / 'roItemMoveMultiple.mos.xml'
-
-# itemmovemultiple with no story id
-@pytest.fixture()
-def roitemmovemultiple2():
-    return MOCK_MOS / 'roItemMoveMultiple2.mos.xml'
-
-# itemmovemultiple with no story tag
-@pytest.fixture()
-def roitemmovemultiple3():
-    return MOCK_MOS / 'roItemMoveMultiple3.mos.xml'
-
-# itemmovemultiple with unknown story
-@pytest.fixture()
-def roitemmovemultiple4():
-    return MOCK_MOS / 'roItemMoveMultiple4.mos.xml'
-
-# itemmovemultiple with unknown story
-@pytest.fixture()
-def roitemmovemultiple5():
-    return MOCK_MOS / 'roItemMoveMultiple5.mos.xml'
-
-# itemmovemultiple with no target item id
-@pytest.fixture()
-def roitemmovemultiple6():
-    return MOCK_MOS / 'roItemMoveMultiple6.mos.xml'
-
-# itemmovemultiple with unknown target item
-@pytest.fixture()
-def roitemmovemultiple7():
-    return MOCK_MOS / 'roItemMoveMultiple7.mos.xml'
-
-# itemmovemultiple with unknown source item
-@pytest.fixture()
-def roitemmovemultiple8():
-    return MOCK_MOS / 'roItemMoveMultiple8.mos.xml'
-
-@pytest.fixture()
-def rometadatareplace():
-    return MOCK_MOS / 'roMetadataReplace.mos.xml'
-
-@pytest.fixture()
-def roreplace():
-    return MOCK_MOS / 'roReplace.mos.xml'
-
-@pytest.fixture()
-def rodelete():
-    return MOCK_MOS / 'roDelete.mos.xml'
-
-@pytest.fixture()
-def roreadytoair():
-    return MOCK_MOS / 'roReadyToAir.mos.xml'
-
-
-@pytest.fixture()
-def ro_all(rocreate, rostorysend1, rostorysend2, eastoryreplace, eaitemreplace,
-    eastorydelete, eaitemdelete, eastoryinsert, eaiteminsert, eastoryswap,
-    eaitemswap, eastorymove, eaitemmove, rometadatareplace, roreadytoair,
-    rodelete
-):
-    return [
-        rocreate, rostorysend1, rostorysend2, eastoryreplace, eaitemreplace,
-        eastorydelete, eaitemdelete, eastoryinsert, eaiteminsert, eastoryswap,
-        eaitemswap, eastorymove, eaitemmove, rometadatareplace, roreadytoair,
-        rodelete
-    ]
-
-# Various invalid MOS files
-
-@pytest.fixture()
-def rostorysend3():
-    return MOCK_MOS / 'roStorySend3.mos.xml'
-
-@pytest.fixture()
-def rostorysend4():
-    return MOCK_MOS / 'roStorySend4.mos.xml'
+@lru_cache(maxsize=None)
+def _parse_xml(path):
+    """
+    Parse the XML file at *path* once per test session and return its root
+    element. Fixtures must return a copy, as tests are free to modify it.
+    """
+    return ElementTree.parse(path).getroot()
 
-@pytest.fixture()
-def rostorysend5():
-    return MOCK_MOS / 'roStorySend5.mos.xml'
 
-@pytest.fixture()
-def rostorysend6():
-    return MOCK_MOS / 'roStorySend6.mos.xml'
+@pytest.fixture(scope='session')
+def invalid_xml():
+    return MOCK_XML / 'invalid.xml'
 
-@pytest.fixture()
-def roinvalid():
-    return MOCK_MOS / 'roInvalidMos.mos.xml'
+# Mock MOS files, mapping fixture name to file name in MOCK_MOS
+MOS_FILES = {
+    'rocreate': 'roCreate.mos.xml',
+    'rocreate2': 'roCreate2.mos.xml',
+    # roCreate with notes
+    'rocreate3': 'roCreate3.mos.xml',
+    # roCreate with no roEdStart
+    'rocreate4': 'roCreate4.mos.xml',
+    # roCreate with empty roEdStart
+    'rocreate5': 'roCreate5.mos.xml',
+    # roCreate with no roEdStart or story durations
+    'rocreate6': 'roCreate6.mos.xml',
+    'rostorysend1': 'roStorySend1.mos.xml',
+    'rostorysend2': 'roStorySend2.mos.xml',
+    'eastoryreplace': 'roElementActionStoryReplace.mos.xml',
+    # eastoryreplace with unknown story
+    'eastoryreplace2': 'roElementActionStoryReplace2.mos.xml',
+    'eaitemreplace': 'roElementActionItemReplace.mos.xml',
+    # eaitemreplace with unknown story
+    'eaitemreplace2': 'roElementActionItemReplace2.mos.xml',
+    # eaitemreplace with unknown item
+    'eaitemreplace3': 'roElementActionItemReplace3.mos.xml',
+    'eastorydelete': 'roElementActionStoryDelete.mos.xml',
+    # eastorydelete with unknown story
+    'eastorydelete2': 'roElementActionStoryDelete2.mos.xml',
+    'eaitemdelete': 'roElementActionItemDelete.mos.xml',
+    # eaitemdelete with unknown story
+    'eaitemdelete2': 'roElementActionItemDelete2.mos.xml',
+    # eaitemdelete with unknown item
+    'eaitemdelete3': 'roElementActionItemDelete3.mos.xml',
+    'eastoryinsert': 'roElementActionStoryInsert.mos.xml',
+    # eastoryinsert with empty story id
+    'eastoryinsert2': 'roElementActionStoryInsert2.mos.xml',
+    # eastoryinsert with unknown story
+    'eastoryinsert3': 'roElementActionStoryInsert3.mos.xml',
+    # eastoryinsert with duplicate story
+    'eastoryinsert4': 'roElementActionStoryInsert4.mos.xml',
+    'eaiteminsert': 'roElementActionItemInsert.mos.xml',
+    # eaiteminsert with unknown story
+    'eaiteminsert2': 'roElementActionItemInsert2.mos.xml',
+    # eaiteminsert with no item id
+    'eaiteminsert3': 'roElementActionItemInsert3.mos.xml',
+    # eaiteminsert with unknown item
+    'eaiteminsert4': 'roElementActionItemInsert4.mos.xml',
+    # eastoryswap with empty element_target
+    'eastoryswap': 'roElementActionStorySwap.mos.xml',
+    # eastoryswap with empty storyid in element_target
+    'eastoryswap2': 'roElementActionStorySwap2.mos.xml',
+    # eastoryswap with unknown story 1
+    'eastoryswap3': 'roElementActionStorySwap3.mos.xml',
+    # eastoryswap with unknown story 2
+    'eastoryswap4': 'roElementActionStorySwap4.mos.xml',
+    'eaitemswap': 'roElementActionItemSwap.mos.xml',
+    # eaitemswap with unknown story
+    'eaitemswap2': 'roElementActionItemSwap2.mos.xml',
+    # eaitemswap with unknown item 1
+    'eaitemswap3': 'roElementActionItemSwap3.mos.xml',
+    # eaitemswap with unknown item 2
+    'eaitemswap4': 'roElementActionItemSwap4.mos.xml',
+    'eastorymove': 'roElementActionStoryMove.mos.xml',
+    # eastorymove with no target story
+    'eastorymove2': 'roElementActionStoryMove2.mos.xml',
+    # eastorymove with unknown target story
+    'eastorymove3': 'roElementActionStoryMove3.mos.xml',
+    # eastorymove with unknown source story
+    'eastorymove4': 'roElementActionStoryMove4.mos.xml',
+    'eaitemmove': 'roElementActionItemMove.mos.xml',
+    # eaitemmove with unknown story
+    'eaitemmove2': 'roElementActionItemMove2.mos.xml',
+    # eaitemmove with unknown target item
+    'eaitemmove3': 'roElementActionItemMove3.mos.xml',
+    # eaitemmove with unknown source item
+    'eaitemmove4': 'roElementActionItemMove4.mos.xml',
+    'rostoryappend': 'roStoryAppend.mos.xml',
+    'rostoryreplace': 'roStoryReplace.mos.xml',
+    # storyreplace with unknown story
+    'rostoryreplace2': 'roStoryReplace2.mos.xml',
+    # storyreplace with no stories
+    'rostoryreplace3': 'roStoryReplace3.mos.xml',
+    'roitemreplace': 'roItemReplace.mos.xml',
+    # itemreplace with unknown story
+    'roitemreplace2': 'roItemReplace2.mos.xml',
+    # itemreplace with unknown item
+    'roitemreplace3': 'roItemReplace3.mos.xml',
+    'rostorydelete': 'roStoryDelete.mos.xml',
+    # storydelete with unknown story
+    'rostorydelete2': 'roStoryDelete2.mos.xml',
+    'roitemdelete': 'roItemDelete.mos.xml',
+    # itemdelete with unknown story
+    'roitemdelete2': 'roItemDelete2.mos.xml',
+    # itemdelete with unknown item
+    'roitemdelete3': 'roItemDelete3.mos.xml',
+    # itemdelete with no item id
+    'roitemdelete4': 'roItemDelete4.mos.xml',
+    'rostoryinsert': 'roStoryInsert.mos.xml',
+    # storyinsert with unknown story
+    'rostoryinsert2': 'roStoryInsert2.mos.xml',
+    # storyinsert with source story which already exists in RO
+    'rostoryinsert3': 'roStoryInsert3.mos.xml',
+    'roiteminsert': 'roItemInsert.mos.xml',
+    # iteminsert with unknown story
+    'roiteminsert2': 'roItemInsert2.mos.xml',
+    # iteminsert with unknown item
+    'roiteminsert3': 'roItemInsert3.mos.xml',
+    # iteminsert with no item id
+    'roiteminsert4': 'roItemInsert4.mos.xml',
+    # iteminsert with item id already in RO
+    'roiteminsert5': 'roItemInsert5.mos.xml',
+    # iteminsert with no items
+    'roiteminsert6': 'roItemInsert6.mos.xml',
+    'rostorymove': 'roStoryMove.mos.xml',
+    # storymove with no target story
+    'rostorymove2': 'roStoryMove2.mos.xml',
+    # storymove with no stories
+    'rostorymove3': 'roStoryMove3.mos.xml',
+    # storymove with unknown source story
+    'rostorymove4': 'roStoryMove4.mos.xml',
+    # storymove with unknown target story
+    'rostorymove5': 'roStoryMove5.mos.xml',
+    'roitemmovemultiple': 'roItemMoveMultiple.mos.xml',
+    # itemmovemultiple with no story id
+    'roitemmovemultiple2': 'roItemMoveMultiple2.mos.xml',
+    # itemmovemultiple with no story tag
+    'roitemmovemultiple3': 'roItemMoveMultiple3.mos.xml',
+    # itemmovemultiple with unknown story
+    'roitemmovemultiple4': 'roItemMoveMultiple4.mos.xml',
+    # itemmovemultiple with unknown story
+    'roitemmovemultiple5': 'roItemMoveMultiple5.mos.xml',
+    # itemmovemultiple with no target item id
+    'roitemmovemultiple6': 'roItemMoveMultiple6.mos.xml',
+    # itemmovemultiple with unknown target item
+    'roitemmovemultiple7': 'roItemMoveMultiple7.mos.xml',
+    # itemmovemultiple with unknown source item
+    'roitemmovemultiple8': 'roItemMoveMultiple8.mos.xml',
+    # itemmovemultiple with source item above target item
+    'roitemmovemultiple9': 'roItemMoveMultiple9.mos.xml',
+    # itemmovemultiple with a repeated source item
+    'roitemmovemultiple10': 'roItemMoveMultiple10.mos.xml',
+    # itemmovemultiple with target item also given as a source item
+    'roitemmovemultiple11': 'roItemMoveMultiple11.mos.xml',
+    'rometadatareplace': 'roMetadataReplace.mos.xml',
+    'roreplace': 'roReplace.mos.xml',
+    'rodelete': 'roDelete.mos.xml',
+    'roreadytoair': 'roReadyToAir.mos.xml',
+    # Various invalid MOS files
+    'rostorysend3': 'roStorySend3.mos.xml',
+    'rostorysend4': 'roStorySend4.mos.xml',
+    'rostorysend5': 'roStorySend5.mos.xml',
+    'rostorysend6': 'roStorySend6.mos.xml',
+    'roinvalid': 'roInvalidMos.mos.xml',
+    'rodelete2': 'roDelete2.mos.xml',
+}
+
+# Paths to the mock MOS files, keyed by fixture name
+MOS_PATHS = {
+    name: MOCK_MOS / filename
+    for name, filename in MOS_FILES.items()
+}
+
+
+def _mos_file_fixture(name: str, path: Path):
+    """
+    Create a fixture called *name* returning *path*
+    """
+    @pytest.fixture(name=name, scope='session')
+    def mos_file():
+        return path
+    return mos_file
+
+
+for _name, _path in MOS_PATHS.items():
+    globals()[_name] = _mos_file_fixture(_name, _path)
+
+
+@pytest.fixture(scope='session')
+def mos_bytes():
+    """
+    Function returning the contents of the MOS file at the given path as
+    bytes, reading each file from disk once per session
+    """
+    cache = {}
+    def get_bytes(path):
+        if path not in cache:
+            cache[path] = Path(path).read_bytes()
+        return cache[path]
+    return get_bytes
+
+
+@pytest.fixture(scope='session')
+def running_order():
+    """
+    Function returning a fresh :class:`~mosromgr.mostypes.RunningOrder` for
+    the roCreate file at the given path. Each file is parsed once per session
+    and a copy of the parsed object is returned, as merge tests modify it.
+    """
+    cache = {}
+    def get_ro(path):
+        if path not in cache:
+            cache[path] = RunningOrder.from_file(path)
+        return copy.deepcopy(cache[path])
+    return get_ro
+
+
+@pytest.fixture(scope='session')
+def ro_all():
+    return tuple(
+        MOS_PATHS[name]
+        for name in (
+            'rocreate', 'rostorysend1', 'rostorysend2', 'eastoryreplace',
+            'eaitemreplace', 'eastorydelete', 'eaitemdelete', 'eastoryinsert',
+            'eaiteminsert', 'eastoryswap', 'eaitemswap', 'eastorymove',
+            'eaitemmove', 'rometadatareplace', 'roreadytoair', 'rodelete',
+        )
+    )
 
-@pytest.fixture()
-def rodelete2():
-    return MOCK_MOS / 'roDelete2.mos.xml'
 
 @pytest.fixture()
 def story_xml():
-    return ElementTree.parse(MOCK_XML / 'story.xml').getroot()
+    return copy.deepcopy(_parse_xml(MOCK_XML / 'story.xml'))
 
 @pytest.fixture()
 def story2_xml():
-    return ElementTree.parse(MOCK_XML / 'story2.xml').getroot()
+    return copy.deepcopy(_parse_xml(MOCK_XML / 'story2.xml'))
 
 @pytest.fixture()
 def story3_xml():
-    return ElementTree.parse(MOCK_XML / 'story3.xml').getroot()
+    return copy.deepcopy(_parse_xml(MOCK_XML / 'story3.xml'))
 
 @pytest.fixture()
 def item_mosart_xml():
-    return ElementTree.parse(MOCK_XML / 'item_mosart.xml').getroot()
+    return copy.deepcopy(_parse_xml(MOCK_XML / 'item_mosart.xml'))
 
 @pytest.fixture()
 def item_note_xml():
-    return ElementTree.parse(MOCK_XML / 'item_note.xml').getroot()
+    return copy.deepcopy(_parse_xml(MOCK_XML / 'item_note.xml'))
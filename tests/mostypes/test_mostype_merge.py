@@ -2,20 +2,18 @@
 # Copyright 2021 BBC
 # SPDX-License-Identifier: Apache-2.0
 
-import warnings
-
 import pytest
 
 from mosromgr.mostypes import *
 from mosromgr.exc import *
 
 
-def test_story_send(rocreate, rostorysend1):
+def test_story_send(rocreate, rostorysend1, running_order):
     """
     GIVEN: Running order and StorySend message (Add contents to STORY 1)
     EXPECT: Running order with storyBody present in STORY 1
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ss = StorySend.from_file(rostorysend1)
     d = ro.dict
     assert len(d['mos']['roCreate']['story']) == 3
@@ -27,12 +25,12 @@ def test_story_send(rocreate, rostorysend1):
     assert ro.base_tag.tag == 'roCreate'
     assert ss.base_tag.tag == 'roStorySend'
 
-def test_metadata_replace(rocreate, rometadatareplace):
+def test_metadata_replace(rocreate, rometadatareplace, running_order):
     """
     GIVEN: Running order and roMetadataReplace message (with updated roSlug field)
     EXPECT: Running order with roSlug field: RO SLUG NEW
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     mdr = MetaDataReplace.from_file(rometadatareplace)
     d = ro.dict
     assert d['mos']['roCreate']['roEdStart'] == '2020-01-01T12:30:00'
@@ -56,12 +54,12 @@ def test_metadata_replace(rocreate, rometadatareplace):
     assert 'roChannel' in d['mos']['roCreate']
     assert d['mos']['roCreate']['roChannel'] == 'bbcnews'
 
-def test_story_append(rocreate, rostoryappend):
+def test_story_append(rocreate, rostoryappend, running_order):
     """
     GIVEN: Running order and roStoryAppend message (add STORYNEW1 and STORYNEW2)
     EXPECT: Running order with STORYNEW1 and STORYNEW2 added to the end
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     sa = StoryAppend.from_file(rostoryappend)
     d = ro.dict
     assert len(d['mos']['roCreate']['story']) == 3
@@ -74,12 +72,12 @@ def test_story_append(rocreate, rostoryappend):
     assert ro.base_tag.tag == 'roCreate'
     assert sa.base_tag.tag == 'roStoryAppend'
 
-def test_story_delete(rocreate, rostorydelete):
+def test_story_delete(rocreate, rostorydelete, running_order):
     """
     GIVEN: Running order and roStoryDelete message (delete STORY1 and STORY2)
     EXPECT: Running order with just STORY3 in
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     sd = StoryDelete.from_file(rostorydelete)
     d = ro.dict
     assert isinstance(d['mos']['roCreate']['story'], list)
@@ -92,29 +90,28 @@ def test_story_delete(rocreate, rostorydelete):
     assert ro.base_tag.tag == 'roCreate'
     assert sd.base_tag.tag == 'roStoryDelete'
 
-def test_story_delete_no_matching_stories(rocreate, rostorydelete2):
+def test_story_delete_no_matching_stories(rocreate, rostorydelete2, running_order):
     """
     GIVEN: Running order and roStoryDelete message with no matching stories
     EXPECT: Running order unaltered, with merge error
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     sd = StoryDelete.from_file(rostorydelete2)
     d_before = ro.dict
 
-    with warnings.catch_warnings(record=True) as w:
+    with pytest.warns(StoryNotFoundWarning) as w:
         ro += sd
     assert len(w) == 1
-    assert w[0].category == StoryNotFoundWarning
 
     d_after = ro.dict
     assert d_before == d_after
 
-def test_story_insert(rocreate, rostoryinsert):
+def test_story_insert(rocreate, rostoryinsert, running_order):
     """
     GIVEN: Running order and roStoryInsert message (insert 2 new stories)
     EXPECT: Running order new stories added
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     si = StoryInsert.from_file(rostoryinsert)
     d = ro.dict
     stories = d['mos']['roCreate']['story']
@@ -131,12 +128,12 @@ def test_story_insert(rocreate, rostoryinsert):
     assert ro.base_tag.tag == 'roCreate'
     assert si.base_tag.tag == 'roStoryInsert'
 
-def test_story_insert_with_no_target_story(rocreate, rostoryinsert2):
+def test_story_insert_with_no_target_story(rocreate, rostoryinsert2, running_order):
     """
     GIVEN: Running order and roStoryInsert message with no target story
     EXPECT: Running order unchanged, and a merge error
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     si = StoryInsert.from_file(rostoryinsert2)
     d_before = ro.dict
 
@@ -146,29 +143,28 @@ def test_story_insert_with_no_target_story(rocreate, rostoryinsert2):
     d_after = ro.dict
     assert d_before == d_after
 
-def test_story_insert_with_known_target_story(rocreate, rostoryinsert3):
+def test_story_insert_with_known_target_story(rocreate, rostoryinsert3, running_order):
     """
     GIVEN: Running order and roStoryInsert message with already known source story
     EXPECT: Running order unchanged, and a warning
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     si = StoryInsert.from_file(rostoryinsert3)
     d_before = ro.dict
 
-    with warnings.catch_warnings(record=True) as w:
+    with pytest.warns(DuplicateStoryWarning) as w:
         ro += si
     assert len(w) == 1
-    assert w[0].category == DuplicateStoryWarning
 
     d_after = ro.dict
     assert d_before == d_after
 
-def test_story_move(rocreate, rostorymove):
+def test_story_move(rocreate, rostorymove, running_order):
     """
     GIVEN: Running order and roStoryMove message (move STORY1 above STORY3)
     EXPECT: Running order with STORY3 at the top
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     sm = StoryMove.from_file(rostorymove)
     d = ro.dict
     stories = d['mos']['roCreate']['story']
@@ -183,12 +179,12 @@ def test_story_move(rocreate, rostorymove):
     assert ro.base_tag.tag == 'roCreate'
     assert sm.base_tag.tag == 'roStoryMove'
 
-def test_story_move_to_bottom(rocreate, rostorymove2):
+def test_story_move_to_bottom(rocreate, rostorymove2, running_order):
     """
     GIVEN: Running order and roStoryMove message (move STORY1 above STORY3)
     EXPECT: Running order with STORY1 at the bottom
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     sm = StoryMove.from_file(rostorymove2)
     d = ro.dict
     stories = d['mos']['roCreate']['story']
@@ -201,12 +197,12 @@ def test_story_move_to_bottom(rocreate, rostorymove2):
     story_ids = [s['storyID'] for s in stories]
     assert story_ids == ['STORY2', 'STORY3', 'STORY1']
 
-def test_story_move_no_stories(rocreate, rostorymove3):
+def test_story_move_no_stories(rocreate, rostorymove3, running_order):
     """
     GIVEN: Running order and roStoryMove message with no stories
     EXPECT: Running order unchanged, with a merge error
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     sm = StoryMove.from_file(rostorymove3)
     d_before = ro.dict
 
@@ -216,12 +212,12 @@ def test_story_move_no_stories(rocreate, rostorymove3):
     d_after = ro.dict
     assert d_before == d_after
 
-def test_story_move_with_unknown_source_story(rocreate, rostorymove4):
+def test_story_move_with_unknown_source_story(rocreate, rostorymove4, running_order):
     """
     GIVEN: Running order and roStoryMove message with an unknown source story
     EXPECT: Running order unchanged, with a merge error
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     sm = StoryMove.from_file(rostorymove4)
     d_before = ro.dict
 
@@ -231,12 +227,12 @@ def test_story_move_with_unknown_source_story(rocreate, rostorymove4):
     d_after = ro.dict
     assert d_before == d_after
 
-def test_story_move_with_unknown_target_story(rocreate, rostorymove5):
+def test_story_move_with_unknown_target_story(rocreate, rostorymove5, running_order):
     """
     GIVEN: Running order and roStoryMove message with an unknown target story
     EXPECT: Running order unchanged, with a merge error
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     sm = StoryMove.from_file(rostorymove5)
     d_before = ro.dict
 
@@ -246,12 +242,12 @@ def test_story_move_with_unknown_target_story(rocreate, rostorymove5):
     d_after = ro.dict
     assert d_before == d_after
 
-def test_story_replace(rocreate, rostoryreplace):
+def test_story_replace(rocreate, rostoryreplace, running_order):
     """
     GIVEN: Running order and roStoryReplace message (STORY 1 for STORY ONE)
     EXPECT: Running order with STORY ONE and no STORY 1
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     sr = StoryReplace.from_file(rostoryreplace)
     d = ro.dict
     assert len(d['mos']['roCreate']['story']) == 3
@@ -270,12 +266,12 @@ def test_story_replace(rocreate, rostoryreplace):
     assert ro.base_tag.tag == 'roCreate'
     assert sr.base_tag.tag == 'roStoryReplace'
 
-def test_story_replace_unknown_story(rocreate, rostoryreplace2):
+def test_story_replace_unknown_story(rocreate, rostoryreplace2, running_order):
     """
     GIVEN: Running order and roStoryReplace message with an unknown story
     EXPECT: Running order unchanged, with a merge error
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     sr = StoryReplace.from_file(rostoryreplace2)
     d_before = ro.dict
 
@@ -285,12 +281,12 @@ def test_story_replace_unknown_story(rocreate, rostoryreplace2):
     d_after = ro.dict
     assert d_before == d_after
 
-def test_story_replace_no_stories(rocreate, rostoryreplace3):
+def test_story_replace_no_stories(rocreate, rostoryreplace3, running_order):
     """
     GIVEN: Running order and roStoryReplace message with no stories
     EXPECT: Running order unchanged, with a merge error
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     sr = StoryReplace.from_file(rostoryreplace3)
     d_before = ro.dict
 
@@ -300,12 +296,12 @@ def test_story_replace_no_stories(rocreate, rostoryreplace3):
     d_after = ro.dict
     assert d_before == d_after
 
-def test_item_delete(rocreate, roitemdelete):
+def test_item_delete(rocreate, roitemdelete, running_order):
     """
     GIVEN: Running order and roItemDelete message (STORY 1 for STORY ONE)
     EXPECT: Running order with STORY ONE and no STORY 1
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     id = ItemDelete.from_file(roitemdelete)
     d = ro.dict
     assert len(d['mos']['roCreate']['story'][0]['item']) == 3
@@ -317,12 +313,12 @@ def test_item_delete(rocreate, roitemdelete):
     assert ro.base_tag.tag == 'roCreate'
     assert id.base_tag.tag == 'roItemDelete'
 
-def test_item_delete_no_story(rocreate, roitemdelete2):
+def test_item_delete_no_story(rocreate, roitemdelete2, running_order):
     """
     GIVEN: Running order and roItemDelete message (STORY 1 for STORY ONE)
     EXPECT: Running order unchanged, and a merge error
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     id = ItemDelete.from_file(roitemdelete2)
     d = ro.dict
     assert len(d['mos']['roCreate']['story'][0]['item']) == 3
@@ -333,30 +329,29 @@ def test_item_delete_no_story(rocreate, roitemdelete2):
     
     assert len(d['mos']['roCreate']['story'][0]['item']) == 3
 
-def test_item_delete_item_not_found(rocreate, roitemdelete3):
+def test_item_delete_item_not_found(rocreate, roitemdelete3, running_order):
     """
     GIVEN: Running order and roItemDelete message (STORY 1 for STORY ONE)
     EXPECT: Running order unchanged, with a warning
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     id = ItemDelete.from_file(roitemdelete3)
     d = ro.dict
     assert len(d['mos']['roCreate']['story'][0]['item']) == 3
 
-    with warnings.catch_warnings(record=True) as w:
+    with pytest.warns(ItemNotFoundWarning) as w:
         ro += id
     assert len(w) == 1
-    assert w[0].category == ItemNotFoundWarning
 
     d = ro.dict
     assert len(d['mos']['roCreate']['story'][0]['item']) == 3
 
-def test_item_insert(rocreate, roiteminsert):
+def test_item_insert(rocreate, roiteminsert, running_order):
     """
     GIVEN: Running order and roItemInsert message (ITEM4 and ITEM5)
     EXPECT: Running order with ITEM4 and ITEM5 above ITEM2
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ii = ItemInsert.from_file(roiteminsert)
     d = ro.dict
     items = d['mos']['roCreate']['story'][0]['item']
@@ -373,12 +368,12 @@ def test_item_insert(rocreate, roiteminsert):
     assert ro.base_tag.tag == 'roCreate'
     assert ii.base_tag.tag == 'roItemInsert'
 
-def test_item_insert_with_unknown_story(rocreate, roiteminsert2):
+def test_item_insert_with_unknown_story(rocreate, roiteminsert2, running_order):
     """
     GIVEN: Running order and roItemInsert message with unknown story
     EXPECT: Running order unchanged, an a merge error
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ii = ItemInsert.from_file(roiteminsert2)
     d_before = ro.dict
 
@@ -388,12 +383,12 @@ def test_item_insert_with_unknown_story(rocreate, roiteminsert2):
     d_after = ro.dict
     assert d_before == d_after
 
-def test_item_insert_with_unknown_item(rocreate, roiteminsert3):
+def test_item_insert_with_unknown_item(rocreate, roiteminsert3, running_order):
     """
     GIVEN: Running order and roItemInsert message with an unknown item
     EXPECT: Running order unchanged, with a merge error
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ii = ItemInsert.from_file(roiteminsert3)
     d_before = ro.dict
 
@@ -403,12 +398,12 @@ def test_item_insert_with_unknown_item(rocreate, roiteminsert3):
     d_after = ro.dict
     assert d_before == d_after
 
-def test_item_insert_move_to_bottom(rocreate, roiteminsert4):
+def test_item_insert_move_to_bottom(rocreate, roiteminsert4, running_order):
     """
     GIVEN: Running order and roItemInsert message with no target item ID
     EXPECT: Running order with ITEM4 and ITEM5 at the bottom
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ii = ItemInsert.from_file(roiteminsert4)
     d = ro.dict
     items = d['mos']['roCreate']['story'][0]['item']
@@ -423,12 +418,12 @@ def test_item_insert_move_to_bottom(rocreate, roiteminsert4):
     item_ids = [i['itemID'] for i in items]
     assert item_ids == ['ITEM1', 'ITEM2', 'ITEM3', 'ITEM4', 'ITEM5']
 
-def test_item_move_multiple(rocreate, roitemmovemultiple):
+def test_item_move_multiple(rocreate, roitemmovemultiple, running_order):
     """
     GIVEN: Running order and roItemMoveMultiple message (ITEM2, ITEM3 above ITEM1 in STORY1)
     EXPECT: Running order with STORY1 items in order (ITEM2, ITEM3, ITEM1)
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     imm = ItemMoveMultiple.from_file(roitemmovemultiple)
     d = ro.dict
     items = d['mos']['roCreate']['story'][0]['item']
@@ -445,12 +440,12 @@ def test_item_move_multiple(rocreate, roitemmovemultiple):
     assert ro.base_tag.tag == 'roCreate'
     assert imm.base_tag.tag == 'roItemMoveMultiple'
 
-def test_item_move_multiple_no_story_id(rocreate, roitemmovemultiple2):
+def test_item_move_multiple_no_story_id(rocreate, roitemmovemultiple2, running_order):
     """
     GIVEN: Running order and roItemMoveMultiple message with no story id
     EXPECT: Running order unchanged, and a merge error
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     imm = ItemMoveMultiple.from_file(roitemmovemultiple2)
     d_before = ro.dict
 
@@ -460,12 +455,12 @@ def test_item_move_multiple_no_story_id(rocreate, roitemmovemultiple2):
     d_after = ro.dict
     assert d_before == d_after
 
-def test_item_move_multiple_no_story(rocreate, roitemmovemultiple3):
+def test_item_move_multiple_no_story(rocreate, roitemmovemultiple3, running_order):
     """
     GIVEN: Running order and roItemMoveMultiple message with no story tag
     EXPECT: Running order unchanged, and a merge error
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     imm = ItemMoveMultiple.from_file(roitemmovemultiple3)
     d_before = ro.dict
 
@@ -475,12 +470,12 @@ def test_item_move_multiple_no_story(rocreate, roitemmovemultiple3):
     d_after = ro.dict
     assert d_before == d_after
 
-def test_item_move_multiple_unknown_story(rocreate, roitemmovemultiple4):
+def test_item_move_multiple_unknown_story(rocreate, roitemmovemultiple4, running_order):
     """
     GIVEN: Running order and roItemMoveMultiple message with an unknown story
     EXPECT: Running order unchanged, and a merge error
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     imm = ItemMoveMultiple.from_file(roitemmovemultiple4)
     d_before = ro.dict
 
@@ -490,13 +485,13 @@ def test_item_move_multiple_unknown_story(rocreate, roitemmovemultiple4):
     d_after = ro.dict
     assert d_before == d_after
 
-def test_item_move_multiple_unknown_story(rocreate, roitemmovemultiple5):
+def test_item_move_multiple_unknown_story(rocreate, roitemmovemultiple5, running_order):
     """
     GIVEN: Running order and roItemMoveMultiple message (ITEM2 and ITEM3 above
     ITEM1 in STORY1)
     EXPECT: Running order with STORY1 items in order (ITEM2, ITEM3, ITEM1)
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     imm = ItemMoveMultiple.from_file(roitemmovemultiple5)
     d_before = ro.dict
 
@@ -506,13 +501,13 @@ def test_item_move_multiple_unknown_story(rocreate, roitemmovemultiple5):
     d_after = ro.dict
     assert d_before == d_after
 
-def test_item_move_multiple_move_to_bottom(rocreate, roitemmovemultiple6):
+def test_item_move_multiple_move_to_bottom(rocreate, roitemmovemultiple6, running_order):
     """
     GIVEN: Running order and roItemMoveMultiple message (ITEM1 and ITEM2 to
     bottom of STORY1)
     EXPECT: Running order with STORY1 items in order (ITEM3, ITEM1, ITEM2)
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     imm = ItemMoveMultiple.from_file(roitemmovemultiple6)
     d = ro.dict
     items = d['mos']['roCreate']['story'][0]['item']
@@ -527,12 +522,33 @@ def test_item_move_multiple_move_to_bottom(rocreate, roitemmovemultiple6):
     item_ids = [i['itemID'] for i in items]
     assert item_ids == ['ITEM3', 'ITEM1', 'ITEM2']
 
-def test_item_move_multiple_unknown_target_item(rocreate, roitemmovemultiple7):
+def test_item_move_multiple_source_above_target(rocreate, roitemmovemultiple9, running_order):
+    """
+    GIVEN: Running order and roItemMoveMultiple message (ITEM1 above ITEM3 in
+    STORY1)
+    EXPECT: Running order with STORY1 items in order (ITEM2, ITEM1, ITEM3)
+    """
+    ro = running_order(rocreate)
+    imm = ItemMoveMultiple.from_file(roitemmovemultiple9)
+    d = ro.dict
+    items = d['mos']['roCreate']['story'][0]['item']
+    assert len(items) == 3
+    item_ids = [i['itemID'] for i in items]
+    assert item_ids == ['ITEM1', 'ITEM2', 'ITEM3']
+
+    ro += imm
+    d = ro.dict
+    items = d['mos']['roCreate']['story'][0]['item']
+    assert len(items) == 3
+    item_ids = [i['itemID'] for i in items]
+    assert item_ids == ['ITEM2', 'ITEM1', 'ITEM3']
+
+def test_item_move_multiple_unknown_target_item(rocreate, roitemmovemultiple7, running_order):
     """
     GIVEN: Running order and roItemMoveMultiple message with unknown target item
     EXPECT: Running order unchanged, and a merge error
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     imm = ItemMoveMultiple.from_file(roitemmovemultiple7)
     d_before = ro.dict
 
@@ -542,12 +558,12 @@ def test_item_move_multiple_unknown_target_item(rocreate, roitemmovemultiple7):
     d_after = ro.dict
     assert d_before == d_after
 
-def test_item_move_multiple_unknown_source_item(rocreate, roitemmovemultiple8):
+def test_item_move_multiple_unknown_source_item(rocreate, roitemmovemultiple8, running_order):
     """
     GIVEN: Running order and roItemMoveMultiple message with unknown source item
     EXPECT: Running order unchanged, and a merge error
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     imm = ItemMoveMultiple.from_file(roitemmovemultiple8)
     d_before = ro.dict
 
@@ -557,12 +573,44 @@ def test_item_move_multiple_unknown_source_item(rocreate, roitemmovemultiple8):
     d_after = ro.dict
     assert d_before == d_after
 
-def test_item_replace(rocreate, roitemreplace):
+def test_item_move_multiple_duplicate_source_item(rocreate, roitemmovemultiple10, running_order):
+    """
+    GIVEN: Running order and roItemMoveMultiple message with a repeated source
+    item
+    EXPECT: Running order unchanged, and a merge error
+    """
+    ro = running_order(rocreate)
+    imm = ItemMoveMultiple.from_file(roitemmovemultiple10)
+    d_before = ro.dict
+
+    with pytest.raises(MosMergeError):
+        ro += imm
+
+    d_after = ro.dict
+    assert d_before == d_after
+
+def test_item_move_multiple_target_is_source_item(rocreate, roitemmovemultiple11, running_order):
+    """
+    GIVEN: Running order and roItemMoveMultiple message with the target item
+    also given as a source item
+    EXPECT: Running order unchanged, and a merge error
+    """
+    ro = running_order(rocreate)
+    imm = ItemMoveMultiple.from_file(roitemmovemultiple11)
+    d_before = ro.dict
+
+    with pytest.raises(MosMergeError):
+        ro += imm
+
+    d_after = ro.dict
+    assert d_before == d_after
+
+def test_item_replace(rocreate, roitemreplace, running_order):
     """
     GIVEN: Running order and roItemReplace message (add NEW to ITEM21 slug)
     EXPECT: Running order with STORY2 ITEM21 slug as 'NEW ITEM 21'
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ir = ItemReplace.from_file(roitemreplace)
     d = ro.dict
     items = d['mos']['roCreate']['story'][1]['item']
@@ -579,12 +627,12 @@ def test_item_replace(rocreate, roitemreplace):
     assert ro.base_tag.tag == 'roCreate'
     assert ir.base_tag.tag == 'roItemReplace'
 
-def test_item_replace_unknown_story(rocreate, roitemreplace2):
+def test_item_replace_unknown_story(rocreate, roitemreplace2, running_order):
     """
     GIVEN: Running order and roItemReplace message with unknown story
     EXPECT: Running order unchanged, and a merge error
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ir = ItemReplace.from_file(roitemreplace2)
     d_before = ro.dict
 
@@ -594,12 +642,12 @@ def test_item_replace_unknown_story(rocreate, roitemreplace2):
     d_after = ro.dict
     assert d_before == d_after
 
-def test_item_replace_unknown_item(rocreate, roitemreplace3):
+def test_item_replace_unknown_item(rocreate, roitemreplace3, running_order):
     """
     GIVEN: Running order and roItemReplace message with unknown story
     EXPECT: Running order unchanged, and a merge error
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ir = ItemReplace.from_file(roitemreplace3)
     d_before = ro.dict
 
@@ -609,28 +657,30 @@ def test_item_replace_unknown_item(rocreate, roitemreplace3):
     d_after = ro.dict
     assert d_before == d_after
 
-def test_ro_replace(rocreate, roreplace):
+def test_ro_replace(rocreate, roreplace, running_order):
     """
     GIVEN: Running order and roReplace message (replace roID's contents)
     EXPECT: Running order with roSlug 'RO SLUG NEW'
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ror = RunningOrderReplace.from_file(roreplace)
     d = ro.dict
     assert d['mos']['roCreate']['roSlug'] == 'RO SLUG'
+    assert ro.ro_slug == 'RO SLUG'
 
     ro += ror
     d = ro.dict
     assert d['mos']['roCreate']['roSlug'] == 'RO SLUG NEW'
+    assert ro.ro_slug == 'RO SLUG NEW'
     assert ro.base_tag.tag == 'roCreate'
     assert ror.base_tag.tag == 'roReplace'
 
-def test_ready_to_air(rocreate, roreadytoair):
+def test_ready_to_air(rocreate, roreadytoair, running_order):
     """
     GIVEN: Running order and roReadyToAir message
     EXPECT: Running order with no changes
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     rta = ReadyToAir.from_file(roreadytoair)
     d = ro.dict
     assert d['mos']['roCreate']['roSlug'] == 'RO SLUG'
@@ -641,12 +691,12 @@ def test_ready_to_air(rocreate, roreadytoair):
     assert ro.base_tag.tag == 'roCreate'
     assert rta.base_tag.tag == 'roReadyToAir'
 
-def test_running_order_end(rocreate, rodelete):
+def test_running_order_end(rocreate, rodelete, running_order):
     """
     GIVEN: Running order and RunningOrderEnd message
     EXPECT: Running order with roDelete tag
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     rd = RunningOrderEnd.from_file(rodelete)
     d = ro.dict
     ro_id = d['mos']['roCreate']['roID']
@@ -663,38 +713,36 @@ def test_running_order_end(rocreate, rodelete):
     assert ro.base_tag.tag == 'roCreate'
     assert rd.base_tag.tag == 'roDelete'
 
-def test_merge_after_delete(rocreate, rodelete, rostorysend1):
+def test_merge_after_delete(rocreate, rodelete, rostorysend1, running_order):
     """
     GIVEN: A completed RunningOrder and a StorySend
     EXPECT: The RunningOrder should refuse the merge
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     rd = RunningOrderEnd.from_file(rodelete)
     ss = StorySend.from_file(rostorysend1)
     ro += rd
     with pytest.raises(MosCompletedMergeError):
         ro += ss
 
-def test_merge_failure(rocreate, rostorysend3):
+def test_merge_failure(rocreate, rostorysend3, running_order):
     """
     GIVEN: A RunningOrder and an invalid StorySend
     EXPECT: The RunningOrder should fail to merge
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ss3 = StorySend.from_file(rostorysend3)
-    with warnings.catch_warnings(record=True) as w:
+    with pytest.warns(StoryNotFoundWarning) as w:
         ro += ss3
     assert len(w) == 1
-    assert w[0].category == StoryNotFoundWarning
 
-def test_storysend_merge_failure(rocreate, rostorysend6):
+def test_storysend_merge_failure(rocreate, rostorysend6, running_order):
     """
     GIVEN: A RunningOrder and a StorySend with an unknown Story ID
     EXPECT: The RunningOrder should fail to merge
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ss6 = StorySend.from_file(rostorysend6)
-    with warnings.catch_warnings(record=True) as w:
+    with pytest.warns(StoryNotFoundWarning) as w:
         ro += ss6
     assert len(w) == 1
-    assert w[0].category == StoryNotFoundWarning
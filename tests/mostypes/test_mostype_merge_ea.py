@@ -2,20 +2,18 @@
 # Copyright 2021 BBC
 # SPDX-License-Identifier: Apache-2.0
 
-import warnings
-
 import pytest
 
 from mosromgr.mostypes import *
 from mosromgr.exc import *
 
 
-def test_merge_element_action_story_replace(rocreate, eastoryreplace):
+def test_merge_element_action_story_replace(rocreate, eastoryreplace, running_order):
     """
     GIVEN: Running order and EAStoryReplace message (STORY1 for STORY5)
     EXPECT: Running order with STORY5 instead of STORY1
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ea = EAStoryReplace.from_file(eastoryreplace)
     d = ro.dict
     stories = d['mos']['roCreate']['story']
@@ -32,12 +30,12 @@ def test_merge_element_action_story_replace(rocreate, eastoryreplace):
     assert ro.base_tag.tag == 'roCreate'
     assert ea.base_tag.tag == 'roElementAction'
 
-def test_merge_element_action_story_replace_unknown_story(rocreate, eastoryreplace2):
+def test_merge_element_action_story_replace_unknown_story(rocreate, eastoryreplace2, running_order):
     """
     GIVEN: Running order and EAStoryReplace message with unknown story
     EXPECT: Running order unchanged, with a merge error
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ea = EAStoryReplace.from_file(eastoryreplace2)
     d_before = ro.dict
 
@@ -47,12 +45,12 @@ def test_merge_element_action_story_replace_unknown_story(rocreate, eastoryrepla
     d_after = ro.dict
     assert d_before == d_after
 
-def test_merge_element_action_item_replace(rocreate, eaitemreplace):
+def test_merge_element_action_item_replace(rocreate, eaitemreplace, running_order):
     """
     GIVEN: Running order and EAItemReplace message (ITEM1 with ITEM21 in STORY1)
     EXPECT: Running order with ITEM21 in place of ITEM1 In STORY1
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ea = EAItemReplace.from_file(eaitemreplace)
     
     d = ro.dict
@@ -71,12 +69,12 @@ def test_merge_element_action_item_replace(rocreate, eaitemreplace):
     assert ro.base_tag.tag == 'roCreate'
     assert ea.base_tag.tag == 'roElementAction'
 
-def test_merge_element_action_item_replace_unknown_story(rocreate, eaitemreplace2):
+def test_merge_element_action_item_replace_unknown_story(rocreate, eaitemreplace2, running_order):
     """
     GIVEN: Running order and EAItemReplace message with unknown story
     EXPECT: Running order unchanged, with a merge error
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ea = EAItemReplace.from_file(eaitemreplace2)
     d_before = ro.dict
 
@@ -86,12 +84,12 @@ def test_merge_element_action_item_replace_unknown_story(rocreate, eaitemreplace
     d_after = ro.dict
     assert d_before == d_after
 
-def test_merge_element_action_item_replace_unknown_item(rocreate, eaitemreplace3):
+def test_merge_element_action_item_replace_unknown_item(rocreate, eaitemreplace3, running_order):
     """
     GIVEN: Running order and EAItemReplace message with unknown item
     EXPECT: Running order unchanged, with a merge error
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ea = EAItemReplace.from_file(eaitemreplace3)
     d_before = ro.dict
 
@@ -101,12 +99,12 @@ def test_merge_element_action_item_replace_unknown_item(rocreate, eaitemreplace3
     d_after = ro.dict
     assert d_before == d_after
 
-def test_merge_element_action_story_delete(rocreate, eastorydelete):
+def test_merge_element_action_story_delete(rocreate, eastorydelete, running_order):
     """
     GIVEN: Running order and EAStoryDelete message (delete STORY1)
     EXPECT: Running order with no STORY1
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ea = EAStoryDelete.from_file(eastorydelete)
     d = ro.dict
     stories = d['mos']['roCreate']['story']
@@ -123,29 +121,28 @@ def test_merge_element_action_story_delete(rocreate, eastorydelete):
     assert ro.base_tag.tag == 'roCreate'
     assert ea.base_tag.tag == 'roElementAction'
 
-def test_merge_element_action_story_delete_unknown_story(rocreate, eastorydelete2):
+def test_merge_element_action_story_delete_unknown_story(rocreate, eastorydelete2, running_order):
     """
     GIVEN: Running order and EAStoryDelete message with an unknown story
     EXPECT: Running order unchanged, with a warning
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ea = EAStoryDelete.from_file(eastorydelete2)
     d_before = ro.dict
 
-    with warnings.catch_warnings(record=True) as w:
+    with pytest.warns(StoryNotFoundWarning) as w:
         ro += ea
     assert len(w) == 1
-    assert w[0].category == StoryNotFoundWarning
 
     d_after = ro.dict
     assert d_before == d_after
 
-def test_merge_element_action_item_delete(rocreate, eaitemdelete):
+def test_merge_element_action_item_delete(rocreate, eaitemdelete, running_order):
     """
     GIVEN: Running order and EAStoryDelete message (delete STORY1)
     EXPECT: Running order with no STORY1
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ea = EAItemDelete.from_file(eaitemdelete)
     d = ro.dict
     items = d['mos']['roCreate']['story'][0]['item']
@@ -162,46 +159,44 @@ def test_merge_element_action_item_delete(rocreate, eaitemdelete):
     assert ro.base_tag.tag == 'roCreate'
     assert ea.base_tag.tag == 'roElementAction'
 
-def test_merge_element_action_item_delete_unknown_story(rocreate, eaitemdelete2):
+def test_merge_element_action_item_delete_unknown_story(rocreate, eaitemdelete2, running_order):
     """
     GIVEN: Running order and EAStoryDelete message with an unknown story
     EXPECT: Running order unchanged, with a warning
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ea = EAItemDelete.from_file(eaitemdelete2)
     d_before = ro.dict
 
-    with warnings.catch_warnings(record=True) as w:
+    with pytest.warns(StoryNotFoundWarning) as w:
         ro += ea
     assert len(w) == 1
-    assert w[0].category == StoryNotFoundWarning
 
     d_after = ro.dict
     assert d_before == d_after
 
-def test_merge_element_action_item_delete_unknown_item(rocreate, eaitemdelete3):
+def test_merge_element_action_item_delete_unknown_item(rocreate, eaitemdelete3, running_order):
     """
     GIVEN: Running order and EAStoryDelete message with an unknown item
     EXPECT: Running order unchanged, with a warning
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ea = EAItemDelete.from_file(eaitemdelete3)
     d_before = ro.dict
 
-    with warnings.catch_warnings(record=True) as w:
+    with pytest.warns(ItemNotFoundWarning) as w:
         ro += ea
     assert len(w) == 1
-    assert w[0].category == ItemNotFoundWarning
 
     d_after = ro.dict
     assert d_before == d_after
 
-def test_merge_element_action_story_insert(rocreate, eastoryinsert):
+def test_merge_element_action_story_insert(rocreate, eastoryinsert, running_order):
     """
     GIVEN: Running order and EAStoryInsert message (insert STORY5)
     EXPECT: Running order with STORY5 between STORY1 and STORY2
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ea = EAStoryInsert.from_file(eastoryinsert)
     d = ro.dict
     stories = d['mos']['roCreate']['story']
@@ -221,12 +216,12 @@ def test_merge_element_action_story_insert(rocreate, eastoryinsert):
     assert ro.base_tag.tag == 'roCreate'
     assert ea.base_tag.tag == 'roElementAction'
 
-def test_merge_element_action_story_insert_at_bottom(rocreate, eastoryinsert2):
+def test_merge_element_action_story_insert_at_bottom(rocreate, eastoryinsert2, running_order):
     """
     GIVEN: Running order and EAStoryInsert message (insert STORY5)
     EXPECT: Running order with STORY5 at the bottom
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ea = EAStoryInsert.from_file(eastoryinsert2)
     d = ro.dict
     stories = d['mos']['roCreate']['story']
@@ -246,12 +241,12 @@ def test_merge_element_action_story_insert_at_bottom(rocreate, eastoryinsert2):
     assert ro.base_tag.tag == 'roCreate'
     assert ea.base_tag.tag == 'roElementAction'
 
-def test_merge_element_action_story_insert_unknown_story(rocreate, eastoryinsert3):
+def test_merge_element_action_story_insert_unknown_story(rocreate, eastoryinsert3, running_order):
     """
     GIVEN: Running order and EAStoryInsert message (insert STORY5)
     EXPECT: Running order unchanged, with merge error
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ea = EAStoryInsert.from_file(eastoryinsert3)
     d_before = ro.dict
 
@@ -261,29 +256,28 @@ def test_merge_element_action_story_insert_unknown_story(rocreate, eastoryinsert
     d_after = ro.dict
     assert d_before == d_after
 
-def test_merge_element_action_story_insert_duplicate_story(rocreate, eastoryinsert4):
+def test_merge_element_action_story_insert_duplicate_story(rocreate, eastoryinsert4, running_order):
     """
     GIVEN: Running order and EAStoryInsert message (insert STORY5)
     EXPECT: Running order unchanged, with merge error
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ea = EAStoryInsert.from_file(eastoryinsert4)
     d_before = ro.dict
 
-    with warnings.catch_warnings(record=True) as w:
+    with pytest.warns(DuplicateStoryWarning) as w:
         ro += ea
     assert len(w) == 1
-    assert w[0].category == DuplicateStoryWarning
 
     d_after = ro.dict
     assert d_before == d_after
 
-def test_merge_element_action_item_insert(rocreate, eaiteminsert):
+def test_merge_element_action_item_insert(rocreate, eaiteminsert, running_order):
     """
     GIVEN: Running order and EAItemInsert message (insert ITEM 5 in STORY1)
     EXPECT: Running order with ITEM 5 between ITEM1 and ITEM2 in STORY1
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ea = EAItemInsert.from_file(eaiteminsert)
     d = ro.dict
     items = d['mos']['roCreate']['story'][0]['item']
@@ -299,12 +293,12 @@ def test_merge_element_action_item_insert(rocreate, eaiteminsert):
     item_ids = [i['itemID'] for i in items]
     assert item_ids == ['ITEM1', 'ITEM5', 'ITEM2', 'ITEM3']
 
-def test_merge_element_action_item_insert_unknown_story(rocreate, eaiteminsert2):
+def test_merge_element_action_item_insert_unknown_story(rocreate, eaiteminsert2, running_order):
     """
     GIVEN: Running order and EAItemInsert message with unknown story
     EXPECT: Running order unchanged, with a merge error
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ea = EAItemInsert.from_file(eaiteminsert2)
     d_before = ro.dict
 
@@ -314,12 +308,12 @@ def test_merge_element_action_item_insert_unknown_story(rocreate, eaiteminsert2)
     d_after = ro.dict
     assert d_before == d_after
 
-def test_merge_element_action_item_insert_at_bottom(rocreate, eaiteminsert3):
+def test_merge_element_action_item_insert_at_bottom(rocreate, eaiteminsert3, running_order):
     """
     GIVEN: Running order and EAItemInsert message (insert ITEM 5 in STORY1)
     EXPECT: Running order with ITEM 5 at the end
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ea = EAItemInsert.from_file(eaiteminsert3)
     d = ro.dict
     items = d['mos']['roCreate']['story'][0]['item']
@@ -335,12 +329,12 @@ def test_merge_element_action_item_insert_at_bottom(rocreate, eaiteminsert3):
     item_ids = [i['itemID'] for i in items]
     assert item_ids == ['ITEM1', 'ITEM2', 'ITEM3', 'ITEM5']
 
-def test_merge_element_action_item_insert_unknown_item(rocreate, eaiteminsert4):
+def test_merge_element_action_item_insert_unknown_item(rocreate, eaiteminsert4, running_order):
     """
     GIVEN: Running order and EAItemInsert message with unknown item
     EXPECT: Running order unchanged, with a merge error
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ea = EAItemInsert.from_file(eaiteminsert4)
     d_before = ro.dict
 
@@ -350,12 +344,12 @@ def test_merge_element_action_item_insert_unknown_item(rocreate, eaiteminsert4):
     d_after = ro.dict
     assert d_before == d_after
 
-def test_merge_element_action_story_swap_missing_target(rocreate, eastoryswap):
+def test_merge_element_action_story_swap_missing_target(rocreate, eastoryswap, running_order):
     """
     GIVEN: Running order and EAStorySwap message (swap STORY1 and STORY2)
     EXPECT: Running order with positions of STORY1 and STORY2 swapped
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ea = EAStorySwap.from_file(eastoryswap)
     d = ro.dict
     stories = d['mos']['roCreate']['story']
@@ -372,12 +366,12 @@ def test_merge_element_action_story_swap_missing_target(rocreate, eastoryswap):
     assert ro.base_tag.tag == 'roCreate'
     assert ea.base_tag.tag == 'roElementAction'
 
-def test_merge_element_action_story_swap_blank_target_storyid(rocreate, eastoryswap2):
+def test_merge_element_action_story_swap_blank_target_storyid(rocreate, eastoryswap2, running_order):
     """
     GIVEN: Running order and EAStorySwap message (swap STORY1 and STORY2)
     EXPECT: Running order with positions of STORY1 and STORY2 swapped
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ea = EAStorySwap.from_file(eastoryswap2)
     d = ro.dict
     stories = d['mos']['roCreate']['story']
@@ -394,12 +388,12 @@ def test_merge_element_action_story_swap_blank_target_storyid(rocreate, eastorys
     assert ro.base_tag.tag == 'roCreate'
     assert ea.base_tag.tag == 'roElementAction'
 
-def test_merge_element_action_story_swap_unknown_story1(rocreate, eastoryswap3):
+def test_merge_element_action_story_swap_unknown_story1(rocreate, eastoryswap3, running_order):
     """
     GIVEN: Running order and EAStorySwap message with unknown story 1
     EXPECT: Running order unchanged, with a merge error
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ea = EAStorySwap.from_file(eastoryswap3)
     d_before = ro.dict
 
@@ -409,12 +403,12 @@ def test_merge_element_action_story_swap_unknown_story1(rocreate, eastoryswap3):
 
     assert d_before == d_after
 
-def test_merge_element_action_story_swap_unknown_story2(rocreate, eastoryswap4):
+def test_merge_element_action_story_swap_unknown_story2(rocreate, eastoryswap4, running_order):
     """
     GIVEN: Running order and EAStorySwap message with unknown story 2
     EXPECT: Running order unchanged, with a merge error
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ea = EAStorySwap.from_file(eastoryswap4)
     d_before = ro.dict
 
@@ -424,12 +418,12 @@ def test_merge_element_action_story_swap_unknown_story2(rocreate, eastoryswap4):
 
     assert d_before == d_after
 
-def test_merge_element_action_item_swap(rocreate, eaitemswap):
+def test_merge_element_action_item_swap(rocreate, eaitemswap, running_order):
     """
     GIVEN: Running order and EAItemSwap message (swap ITEM1 and ITEM2)
     EXPECT: Running order with positions of ITEM1 and ITEM2 swapped in STORY 1
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ea = EAItemSwap.from_file(eaitemswap)
     d = ro.dict
     items = d['mos']['roCreate']['story'][0]['item']
@@ -447,12 +441,12 @@ def test_merge_element_action_item_swap(rocreate, eaitemswap):
     assert ro.base_tag.tag == 'roCreate'
     assert ea.base_tag.tag == 'roElementAction'
 
-def test_merge_element_action_item_swap_unknown_story(rocreate, eaitemswap2):
+def test_merge_element_action_item_swap_unknown_story(rocreate, eaitemswap2, running_order):
     """
     GIVEN: Running order and EAItemSwap message with an unknown story
     EXPECT: Running order unchanged, with a merge error
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ea = EAItemSwap.from_file(eaitemswap2)
     d_before = ro.dict
 
@@ -462,12 +456,12 @@ def test_merge_element_action_item_swap_unknown_story(rocreate, eaitemswap2):
     d_after = ro.dict
     assert d_before == d_after
 
-def test_merge_element_action_item_swap_unknown_item1(rocreate, eaitemswap3):
+def test_merge_element_action_item_swap_unknown_item1(rocreate, eaitemswap3, running_order):
     """
     GIVEN: Running order and EAItemSwap message with an unknown item
     EXPECT: Running order unchanged, with a merge error
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ea = EAItemSwap.from_file(eaitemswap3)
     d_before = ro.dict
 
@@ -477,12 +471,12 @@ def test_merge_element_action_item_swap_unknown_item1(rocreate, eaitemswap3):
     d_after = ro.dict
     assert d_before == d_after
 
-def test_merge_element_action_item_swap_unknown_item2(rocreate, eaitemswap4):
+def test_merge_element_action_item_swap_unknown_item2(rocreate, eaitemswap4, running_order):
     """
     GIVEN: Running order and EAItemSwap message with an unknown item
     EXPECT: Running order unchanged, with a merge error
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ea = EAItemSwap.from_file(eaitemswap4)
     d_before = ro.dict
 
@@ -492,12 +486,12 @@ def test_merge_element_action_item_swap_unknown_item2(rocreate, eaitemswap4):
     d_after = ro.dict
     assert d_before == d_after
 
-def test_merge_element_action_story_move(rocreate, eastorymove):
+def test_merge_element_action_story_move(rocreate, eastorymove, running_order):
     """
     GIVEN: Running order and EAStoryMove message (move STORY 3 to top)
     EXPECT: Running order with STORY 3 at top, above STORY 1
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ea = EAStoryMove.from_file(eastorymove)
     d = ro.dict
     stories = d['mos']['roCreate']['story']
@@ -514,12 +508,12 @@ def test_merge_element_action_story_move(rocreate, eastorymove):
     assert ro.base_tag.tag == 'roCreate'
     assert ea.base_tag.tag == 'roElementAction'
 
-def test_merge_element_action_story_move_no_target(rocreate, eastorymove2):
+def test_merge_element_action_story_move_no_target(rocreate, eastorymove2, running_order):
     """
     GIVEN: Running order and EAStoryMove message (move STORY 1 to bottom)
     EXPECT: Running order with STORY 1 at bottom
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ea = EAStoryMove.from_file(eastorymove2)
     d = ro.dict
     stories = d['mos']['roCreate']['story']
@@ -537,12 +531,12 @@ def test_merge_element_action_story_move_no_target(rocreate, eastorymove2):
     assert ro.base_tag.tag == 'roCreate'
     assert ea.base_tag.tag == 'roElementAction'
 
-def test_merge_element_action_story_move_unknown_target_story(rocreate, eastorymove3):
+def test_merge_element_action_story_move_unknown_target_story(rocreate, eastorymove3, running_order):
     """
     GIVEN: Running order and EAStoryMove message with unknown target story
     EXPECT: Running order unchanged, with a merge error
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ea = EAStoryMove.from_file(eastorymove3)
     d_before = ro.dict
     
@@ -552,12 +546,12 @@ def test_merge_element_action_story_move_unknown_target_story(rocreate, eastorym
     d_after = ro.dict
     assert d_before == d_after
 
-def test_merge_element_action_story_move_unknown_source_story(rocreate, eastorymove4):
+def test_merge_element_action_story_move_unknown_source_story(rocreate, eastorymove4, running_order):
     """
     GIVEN: Running order and EAStoryMove message with unknown source story
     EXPECT: Running order unchanged, with a merge error
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ea = EAStoryMove.from_file(eastorymove4)
     d_before = ro.dict
     
@@ -567,12 +561,12 @@ def test_merge_element_action_story_move_unknown_source_story(rocreate, eastorym
     d_after = ro.dict
     assert d_before == d_after
 
-def test_merge_element_action_item_move(rocreate, eaitemmove):
+def test_merge_element_action_item_move(rocreate, eaitemmove, running_order):
     """
     GIVEN: Running order and EAItemMove message (move ITEM3 to top)
     EXPECT: Running order with ITEM3 at top of STORY 1
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ea = EAItemMove.from_file(eaitemmove)
     d = ro.dict
     items = d['mos']['roCreate']['story'][0]['item']
@@ -590,12 +584,12 @@ def test_merge_element_action_item_move(rocreate, eaitemmove):
     assert ro.base_tag.tag == 'roCreate'
     assert ea.base_tag.tag == 'roElementAction'
 
-def test_merge_element_action_item_move_with_unknown_story(rocreate, eaitemmove2):
+def test_merge_element_action_item_move_with_unknown_story(rocreate, eaitemmove2, running_order):
     """
     GIVEN: Running order and EAItemMove message with unknown story
     EXPECT: Running order unchanged, with a merge error
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ea = EAItemMove.from_file(eaitemmove2)
 
     d_before = ro.dict
@@ -606,12 +600,12 @@ def test_merge_element_action_item_move_with_unknown_story(rocreate, eaitemmove2
     d_after = ro.dict
     assert d_before == d_after
 
-def test_merge_element_action_item_move_with_unknown_target_item(rocreate, eaitemmove3):
+def test_merge_element_action_item_move_with_unknown_target_item(rocreate, eaitemmove3, running_order):
     """
     GIVEN: Running order and EAItemMove message with unknown target item
     EXPECT: Running order unchanged, with a merge error
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ea = EAItemMove.from_file(eaitemmove3)
 
     d_before = ro.dict
@@ -622,12 +616,12 @@ def test_merge_element_action_item_move_with_unknown_target_item(rocreate, eaite
     d_after = ro.dict
     assert d_before == d_after
 
-def test_merge_element_action_item_move_with_unknown_source_item(rocreate, eaitemmove4):
+def test_merge_element_action_item_move_with_unknown_source_item(rocreate, eaitemmove4, running_order):
     """
     GIVEN: Running order and EAItemMove message with unknown source item
     EXPECT: Running order unchanged, with a merge error
     """
-    ro = RunningOrder.from_file(rocreate)
+    ro = running_order(rocreate)
     ea = EAItemMove.from_file(eaitemmove4)
 
     d_before = ro.dict
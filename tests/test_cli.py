@@ -2,6 +2,9 @@
 # Copyright 2021 BBC
 # SPDX-License-Identifier: Apache-2.0
 
+import sys
+import subprocess
+
 import pytest
 
 from mosromgr.cli import main
@@ -11,6 +14,16 @@ def test_args_incorrect():
     with pytest.raises(SystemExit):
         main(['--nonexistentarg'])
 
+def test_args_incorrect_command():
+    with pytest.raises(SystemExit):
+        main(['merge', '--nonexistentarg'])
+
+def test_args_incorrect_command_usage(capsys):
+    with pytest.raises(SystemExit):
+        main(['detect', '--nonexistentarg'])
+    out, err = capsys.readouterr()
+    assert "{help,detect,inspect,merge}" in err
+
 def test_help(capsys):
     with pytest.raises(SystemExit) as ex:
         main(['--help'])
@@ -27,6 +40,15 @@ def test_help(capsys):
     out, err = capsys.readouterr()
     assert "managing MOS running orders" in out
 
+def test_lazy_imports():
+    "Test the CLI module can be imported without importing the MOS modules"
+    code = (
+        "import sys, mosromgr.cli; "
+        "assert 'mosromgr.mostypes' not in sys.modules; "
+        "assert 'boto3' not in sys.modules"
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)
+
 def test_detect():
     args = main.parser.parse_args(['detect', '-f', 'roCreate.mos.xml'])
     assert args.files == ['roCreate.mos.xml']
@@ -2,8 +2,6 @@
 # Copyright 2021 BBC
 # SPDX-License-Identifier: Apache-2.0
 
-import warnings
-
 import pytest
 from mock import patch
 
@@ -124,17 +122,17 @@ def test_mos_collection_init_files_after_rodelete(rocreate, rodelete, rostorysen
 @patch('mosromgr.utils.s3.boto3')
 @patch('mosromgr.utils.s3.get_file_contents')
 @patch('mosromgr.utils.s3.get_mos_files')
-def test_mos_collection_init_from_s3(get_mos_files, get_file_contents, boto3, rocreate, rodelete):
+def test_mos_collection_init_from_s3(get_mos_files, get_file_contents, boto3, rocreate, rodelete, mos_bytes):
     """
     GIVEN: A bucket name and prefix (mocked to contain two files)
     EXPECT: MosCollection object with 1 reader
     """
     get_mos_files.return_value = ['roCreate.mos.xml', 'roDelete.mos.xml']
     get_file_contents.side_effect = [
-        rocreate.read_text(),
-        rodelete.read_text(),
-        rocreate.read_text(),
-        rodelete.read_text(),
+        mos_bytes(rocreate),
+        mos_bytes(rodelete),
+        mos_bytes(rocreate),
+        mos_bytes(rodelete),
     ]
 
     mc = MosCollection.from_s3(bucket_name='bucket_name', prefix='newsnight')
@@ -192,14 +190,14 @@ def test_mos_collection_merge(rocreate, eastoryinsert, rodelete):
 @patch('mosromgr.utils.s3.get_file_contents')
 @patch('mosromgr.utils.s3.get_mos_files')
 def test_mos_collection_s3_merge(get_mos_files, get_file_contents, boto3,
-    rocreate, eastoryinsert, rodelete):
+    rocreate, eastoryinsert, rodelete, mos_bytes):
     """
     GIVEN: Bucket prefix matching a roCreate and ElementAction (StoryInsert)
     EXPECT: Running order summary, with story from EAStoryInsert added
     """
-    rc = rocreate.read_text()
-    ea = eastoryinsert.read_text()
-    rd = rodelete.read_text()
+    rc = mos_bytes(rocreate)
+    ea = mos_bytes(eastoryinsert)
+    rd = mos_bytes(rodelete)
 
     get_mos_files.return_value = [rc, ea, rd]
     get_file_contents.side_effect = [rc, ea, rd, rc, ea, rd]
@@ -221,10 +219,9 @@ def test_mos_collection_merge_warning(rocreate, rostorysend3, rodelete):
     """
     mos_files = [rocreate, rostorysend3, rodelete]
     mc = MosCollection.from_files(mos_files)
-    with warnings.catch_warnings(record=True) as w:
+    with pytest.warns(StoryNotFoundWarning) as w:
         mc.merge()
     assert len(w) == 1
-    assert w[0].category == StoryNotFoundWarning
 
 def test_mos_collection_merge_error(rocreate, rostoryinsert2, rodelete):
     """
@@ -243,8 +240,7 @@ def test_mos_collection_merge_nonstrict_warning(rocreate, rostoryinsert2, rodele
     """
     mos_files = [rocreate, rostoryinsert2, rodelete]
     mc = MosCollection.from_files(mos_files)
-    with warnings.catch_warnings(record=True) as w:
+    with pytest.warns(MosMergeNonStrictWarning) as w:
         mc.merge(strict=False)
     assert len(w) == 1
-    assert w[0].category == MosMergeNonStrictWarning
     assert mc.completed
@@ -21,26 +21,26 @@ def test_story_init(story_xml):
 def test_story_properties(story_xml, story2_xml, story3_xml):
     "Test we can create a Story element and access its properties"
     story = Story(story_xml)
-    assert type(story.xml) == Element
+    assert type(story.xml) is Element
     assert story.id == 'STORY1'
     assert story.slug == 'STORY 1'
-    assert type(story.items) == list
+    assert type(story.items) is list
     assert len(story.items) == 3
     item = story.items[0]
-    assert type(item) == Item
+    assert type(item) is Item
     assert story.duration == 3
     assert story.offset is None
     assert story.start_time is None
     assert story.end_time is None
-    assert type(story.script) == list
+    assert type(story.script) is list
     assert len(story.script) == 3
     for p in story.script:
-        assert type(p) == str
+        assert type(p) is str
     p1 = story.script[0]
     assert p1 == "Welcome"
     p2 = story.script[1]
     assert p2 == "Welcome again"
-    assert type(story.body) == list
+    assert type(story.body) is list
     assert len(story.body) == 7
     for p in story.body:
         assert type(p) in (str, Item)
@@ -49,7 +49,7 @@ def test_story_properties(story_xml, story2_xml, story3_xml):
     body_part_2 = story.body[1]
     assert body_part_2 == ""
     body_part_3 = story.body[2]
-    assert type(body_part_3) == Item
+    assert type(body_part_3) is Item
 
     story2 = Story(story2_xml)
     assert story2.duration is None
@@ -68,7 +68,7 @@ def test_item_init(item_mosart_xml):
 def test_item_properties(item_mosart_xml):
     "Test we can create a Item element and access its properties"
     item = Item(item_mosart_xml)
-    assert type(item.xml) == Element
+    assert type(item.xml) is Element
     assert item.id == 'ITEM1'
     assert item.slug == 'ITEM 1'
     assert item.note is None
@@ -79,7 +79,7 @@ def test_item_properties(item_mosart_xml):
 def test_item_note_properties(item_note_xml):
     "Test we can create a Item element and access its properties"
     item = Item(item_note_xml)
-    assert type(item.xml) == Element
+    assert type(item.xml) is Element
     assert item.id == 'ITEM2'
     assert item.slug == 'ITEM 2'
     assert item.note == 'THIS IS A NOTE'
@@ -117,6 +117,22 @@ def test_append_node():
     assert root.findall('top')[-2].find('topID').text == "ID4"
     assert root.findall('top')[-1].find('topID').text == "ID5"
 
+def test_replace_children():
+    """
+    GIVEN: A parent and a list of nodes
+    EXPECT: The parent with its children replaced by the nodes, in order
+    """
+    root = ET.fromstring(TESTXMLSTRINGBASE)
+    new_root = ET.fromstring(TESTXMLSTRINGNEW)
+    tops = root.findall('top')
+    nodes = [tops[2], new_root.find('top'), tops[0]]
+
+    replace_children(root, nodes)
+    assert len(root.findall('top')) == 3
+    assert root.findall('top')[0].find('topID').text == "ID3"
+    assert root.findall('top')[1].find('topID').text == "ID5"
+    assert root.findall('top')[2].find('topID').text == "ID1"
+
 def test_find_child_with_id():
     """
     GIVEN: A parent, a child to search for, and an id for the child